@@ -35,27 +35,36 @@ def calculate_rotation_between_points(p1: Vector3, p2: Vector3) -> Quaternion:
     """
     Calculates the rotation quaternion that rotates from point p1 to point p2.
     
-    This implements the method described in the video:
-    1. Convert points to quaternions with w=0
-    2. Calculate q2 * q1.conjugate() 
-    3. Raise to power 1/2 to get correct rotation angle
+    The method described in the video converts the points to quaternions
+    with w=0, calculates q2 * q1.conjugate(), and raises the result to the
+    power 1/2 to get the correct rotation angle. That product is
+    (p1·p2, p1×p2), and its square root has the closed form
+    normalize(|p1||p2| + p1·p2, p1×p2), which is what is computed here.
     
     Args:
-        p1: Starting point on unit sphere
-        p2: Ending point on unit sphere
+        p1: Starting point (usually on the unit sphere)
+        p2: Ending point (usually on the unit sphere)
         
     Returns:
         Quaternion representing the rotation from p1 to p2
     """
-    # Convert points to quaternions with w=0
-    q1 = Quaternion(0, p1.x, p1.y, p1.z)
-    q2 = Quaternion(0, p2.x, p2.y, p2.z)
-    
-    # Calculate rotation: q2 * q1.conjugate()
-    rotation = q2.multiply(q1.conjugate())
-    
-    # To divide the angle by 2, raise this result to power 1/2
-    return rotation.power(0.5)
+    # |p1||p2| with one square root, so the points don't need to be unit length
+    lengths = math.sqrt(p1.dot(p1) * p2.dot(p2))
+    w = lengths + p1.dot(p2)
+
+    # Opposite points: rotate 180° around any axis perpendicular to p1
+    if w < 1e-6 * lengths:
+        axis = p1.cross(Vector3(1, 0, 0))
+        if axis.length() < 1e-6:
+            axis = p1.cross(Vector3(0, 1, 0))
+        axis = axis.normalize()
+        return Quaternion(0, axis.x, axis.y, axis.z)
+
+    # Halfway between the identity and q2 * q1.conjugate()
+    c = p1.cross(p2)
+    inv_norm = 1 / math.sqrt(w * w + c.x * c.x + c.y * c.y + c.z * c.z)
+
+    return Quaternion(w * inv_norm, c.x * inv_norm, c.y * inv_norm, c.z * inv_norm)
 
 def get_rotation_axis_and_angle(q: Quaternion) -> tuple[Vector3, float]:
     """
@@ -72,19 +81,22 @@ def get_rotation_axis_and_angle(q: Quaternion) -> tuple[Vector3, float]:
     Returns:
         A tuple of (axis, angle) where axis is a Vector3 and angle is in radians.
     """
+    # Length of the vector part, which is sin(θ/2) for a unit quaternion
+    sin_half_angle = math.sqrt(q.x * q.x + q.y * q.y + q.z * q.z)
+
     # Handle identity quaternion (no rotation)
-    if abs(q.w) > 0.9999:
+    if sin_half_angle < 1e-12:
         return Vector3(0, 0, 1), 0.0
     
-    # Calculate the angle
-    angle = 2 * math.acos(q.w)
+    # Calculate the angle (atan2 stays accurate near the identity, unlike acos)
+    angle = 2 * math.atan2(sin_half_angle, q.w)
     
     # Calculate the axis (normalized)
-    sin_half_angle = math.sqrt(1 - q.w * q.w)
+    inv_sin_half_angle = 1 / sin_half_angle
     axis = Vector3(
-        q.x / sin_half_angle,
-        q.y / sin_half_angle,
-        q.z / sin_half_angle
+        q.x * inv_sin_half_angle,
+        q.y * inv_sin_half_angle,
+        q.z * inv_sin_half_angle
     )
     
     return axis, angle
@@ -126,8 +138,8 @@ def demo_simple_rotation():
     angle_degrees = math.degrees(angle)
     print(f"Rotation description: Rotation by {angle_degrees:.1f}° around axis {axis}")
     
-    # Apply rotation
-    earth_orientation = rotation.multiply(earth_orientation)
+    # Apply rotation (normalizing keeps the orientation a unit quaternion over many drags)
+    earth_orientation = rotation.multiply_normalized(earth_orientation)
     print(f"New orientation: {earth_orientation.toString()}")
     
     print("\n--- Second Drag Event ---\n")
@@ -152,7 +164,7 @@ def demo_simple_rotation():
     angle_degrees = math.degrees(angle)
     print(f"Rotation description: Rotation by {angle_degrees:.1f}° around axis {axis}")
     
-    earth_orientation = rotation2.multiply(earth_orientation)
+    earth_orientation = rotation2.multiply_normalized(earth_orientation)
     print(f"Final orientation: {earth_orientation.toString()}")
 
 if __name__ == "__main__":
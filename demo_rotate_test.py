@@ -0,0 +1,28 @@
+import math
+from src.vector3 import Vector3
+from src.quaternion import Quaternion
+from src.assert_equal import assert_equal
+from demo_rotate import calculate_rotation_between_points
+
+def test_rotation_between_points():
+
+	p1 = Vector3(1, 0, 0)
+	p2 = Vector3(0, 1, 0)
+
+	rotation = calculate_rotation_between_points(p1, p2)
+
+	assert_equal(rotation, Quaternion.from_axis_angle(Vector3(0, 0, 1), math.pi/2))
+	assert_equal(rotation.transform(p1), p2)
+
+	# The lengths of the points don't change the rotation
+	assert_equal(calculate_rotation_between_points(p1, Vector3(0, 2, 0)), rotation)
+	assert_equal(calculate_rotation_between_points(p1.scale(3), p2), rotation)
+
+def test_rotation_between_opposite_points():
+
+	for p in (Vector3(1, 0, 0), Vector3(0, 0, 2), Vector3(1, 2, 3)):
+		rotation = calculate_rotation_between_points(p, p.scale(-1))
+
+		# A half turn around an axis perpendicular to p
+		assert rotation.w == 0
+		assert_equal(rotation.transform(p), p.scale(-1))
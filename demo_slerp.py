@@ -1,25 +1,25 @@
 import math
+import numpy as np
 from src.vector3 import Vector3
 from src.quaternion import Quaternion
+from src.quaternion_array import QuaternionArray
 from demo_rotate import get_rotation_axis_and_angle
 
-def slerp(q1: Quaternion, q2: Quaternion, t: float, shortestPath: bool = True) -> Quaternion:
+def slerp_setup(q1: Quaternion, q2: Quaternion, shortestPath: bool = True) -> tuple[Quaternion, Quaternion]:
     """
-    Spherical linear interpolation between two quaternions.
+    Precompute the parts of SLERP that do not depend on t.
     
-    This implements SLERP as described in the script:
+    This covers the first two steps of SLERP as described in the script:
     1. Ensure shortest path by checking dot product (if shortestPath=True)
     2. Calculate rotation from q1 to q2
-    3. Apply fraction of rotation using power method
     
     Args:
         q1: Starting quaternion
         q2: Ending quaternion
-        t: Interpolation parameter (0 to 1)
         shortestPath: Whether to ensure shortest path (default: True)
         
     Returns:
-        Interpolated quaternion
+        A tuple of (q1, rotation) where rotation takes q1 to q2
     """
     # Ensure shortest path if requested
     if shortestPath:
@@ -28,14 +28,48 @@ def slerp(q1: Quaternion, q2: Quaternion, t: float, shortestPath: bool = True) -
         if dot_product < 0:
             q2 = Quaternion(-q2.w, -q2.x, -q2.y, -q2.z)
     
-    # Calculate the rotation from q1 to q2
-    rotation = q2.multiply(q1.inverse())
+    # Calculate the rotation from q1 to q2 (the conjugate is the inverse of a unit quaternion)
+    rotation = q2.multiply(q1.conjugate())
     
+    return q1, rotation
+
+def slerp_step(q1: Quaternion, rotation: Quaternion, t: float) -> Quaternion:
+    """
+    Apply a fraction t of a precomputed SLERP rotation to q1 (step 3 of SLERP).
+    
+    Args:
+        q1: Starting quaternion
+        rotation: The rotation from q1 to q2, as returned by slerp_setup
+        t: Interpolation parameter (0 to 1)
+        
+    Returns:
+        Interpolated quaternion
+    """
     # Apply fraction of the rotation
-    fraction_rotation = rotation.power(t)
+    fraction_rotation = rotation.power_unit(t)
     
     return fraction_rotation.multiply(q1)
 
+def slerp(q1: Quaternion, q2: Quaternion, t: float, shortestPath: bool = True) -> Quaternion:
+    """
+    Spherical linear interpolation between two quaternions.
+    
+    When interpolating between the same two quaternions for many values of t,
+    call slerp_setup once and slerp_step for each t instead.
+    
+    Args:
+        q1: Starting quaternion
+        q2: Ending quaternion
+        t: Interpolation parameter (0 to 1)
+        shortestPath: Whether to ensure shortest path (default: True)
+        
+    Returns:
+        Interpolated quaternion
+    """
+    q1, rotation = slerp_setup(q1, q2, shortestPath)
+    
+    return slerp_step(q1, rotation, t)
+
 def demo_slerp(shortestPath: bool = True, steps: int = 10):
     """
     Demo showing how SLERP interpolates between orientations.
@@ -59,27 +93,32 @@ def demo_slerp(shortestPath: bool = True, steps: int = 10):
     print(f"Ensure shortest path: {shortestPath}")
 
     
-    # Calculate dot product for shortest path detection
-    dot_product = q1.w * q2.w + q1.x * q2.x + q1.y * q2.y + q1.z * q2.z
-    
-    # Determine q2_for_rotation (might be negated to ensure shortest path)
-    q2_for_rotation = q2
+    # The rotation from q1 to q2 is the same for every step, so compute it once
+    q1, total_rotation = slerp_setup(q1, q2, shortestPath)
+
     if shortestPath:
+        dot_product = q1.w * q2.w + q1.x * q2.x + q1.y * q2.y + q1.z * q2.z
         print(f"Dot product: {dot_product:.3f}")
         
         if dot_product < 0:
-            q2_for_rotation = Quaternion(-q2.w, -q2.x, -q2.y, -q2.z)
-            print(f"Dot product is negative, so negated q2 is closer: {q2_for_rotation.toString()}")
-            print(f"Changing target quaternion q_2 to {q2_for_rotation.toString()}")
+            # slerp_setup negated q2, so the rotation ends at -q2
+            target = total_rotation.multiply(q1)
+            print(f"Dot product is negative, so negated q2 is closer: {target.toString()}")
+            print(f"Changing target quaternion q_2 to {target.toString()}")
     
-    total_rotation = q2_for_rotation.multiply(q1.inverse())
     total_axis, total_angle = get_rotation_axis_and_angle(total_rotation)
     total_angle_degrees = math.degrees(total_angle)
     print(f"Total rotation: {total_angle_degrees:.1f}° around axis {total_axis}\n")
 
-    for i in range(steps + 1):
-        t = i / steps
-        q = slerp(q1, q2, t, shortestPath)
+    # Raise the total rotation to all the fractions t at once
+    ts = np.linspace(0, 1, steps + 1)
+    fraction_rotations = total_rotation.power_unit(ts)
+
+    # Apply each fraction of the rotation to q1
+    frames = fraction_rotations.multiply(QuaternionArray.from_quaternions([q1]))
+
+    for i, t in enumerate(ts):
+        q = frames[i]
         print(f"t={t:.2f}: q={q}")
 
         # To calculate the transformed basis vectors, use the following:
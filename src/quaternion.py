@@ -1,8 +1,15 @@
 import math
+import numpy as np
+from typing import TYPE_CHECKING, Union
 from .vector3 import Vector3
 
+if TYPE_CHECKING:
+	from .quaternion_array import QuaternionArray
+
 class Quaternion:
 
+	__slots__ = ('w', 'x', 'y', 'z')
+
 	def __init__(self, w: float, x: float, y: float, z: float):
 		"""
 		Construct a quaternion with components w, x, y, z.
@@ -31,17 +38,47 @@ class Quaternion:
 			A new quaternion representing the rotation.
 		"""
 
-		if axis.length() != 1:
-			axis = axis.normalize()
+		ax, ay, az = axis.x, axis.y, axis.z
+
+		# Compare the squared length so unit axes don't need a square root
+		length_squared = ax*ax + ay*ay + az*az
+		if abs(length_squared - 1) > 1e-12:
+			inv_length = 1 / math.sqrt(length_squared)
+			ax, ay, az = ax * inv_length, ay * inv_length, az * inv_length
 
 		half_angle = angle / 2
+		s = math.sin(half_angle)
+
+		return Quaternion(math.cos(half_angle), ax * s, ay * s, az * s)
+
+	@staticmethod
+	def from_scipy(rotation) -> 'Quaternion':
+		"""
+		Construct a quaternion from a single scipy.spatial.transform.Rotation.
 		
-		return Quaternion(
-			math.cos(half_angle),
-			axis.x * math.sin(half_angle),
-			axis.y * math.sin(half_angle),
-			axis.z * math.sin(half_angle)
-		)
+		Args:
+			rotation: The SciPy rotation to convert.
+			
+		Returns:
+			A new unit quaternion representing the same rotation.
+		"""
+		# SciPy stores quaternions scalar-last as (x, y, z, w)
+		x, y, z, w = rotation.as_quat()
+
+		return Quaternion(float(w), float(x), float(y), float(z))
+
+	def to_scipy(self):
+		"""
+		Convert this quaternion to a scipy.spatial.transform.Rotation.
+		
+		SciPy is an optional dependency and is only imported when this is called.
+		
+		Returns:
+			A SciPy rotation representing the same rotation (normalized by SciPy).
+		"""
+		from scipy.spatial.transform import Rotation
+
+		return Rotation.from_quat([self.x, self.y, self.z, self.w])
 
 	def multiply(self, other: 'Quaternion') -> 'Quaternion':
 		"""
@@ -60,23 +97,61 @@ class Quaternion:
 			self.w*other.z+self.x*other.y-self.y*other.x+self.z*other.w
 		)
 
-	def transform(self, v: Vector3) -> Vector3:
+	def multiply_normalized(self, other: 'Quaternion') -> 'Quaternion':
 		"""
-		Transform a vector by this quaternion.
+		Multiply this quaternion by another quaternion and normalize the result.
+		
+		Use this when composing rotations repeatedly, so floating-point drift
+		doesn't accumulate and the result stays a unit quaternion.
 		
 		Args:
-			v: The vector to transform.
+			other: The quaternion to multiply by.
 			
+		Returns:
+			A new unit quaternion representing the normalized product.
+		"""
+		aw, ax, ay, az = self.w, self.x, self.y, self.z
+		bw, bx, by, bz = other.w, other.x, other.y, other.z
+
+		w = aw*bw - ax*bx - ay*by - az*bz
+		x = aw*bx + ax*bw + ay*bz - az*by
+		y = aw*by - ax*bz + ay*bw + az*bx
+		z = aw*bz + ax*by - ay*bx + az*bw
+
+		inv_norm = 1 / math.sqrt(w*w + x*x + y*y + z*z)
+
+		return Quaternion(w * inv_norm, x * inv_norm, y * inv_norm, z * inv_norm)
+
+	def transform(self, v: Vector3) -> Vector3:
+		"""
+		Transform a vector by this (non-zero) quaternion.
+
+		This is equivalent to the sandwich product q * (0, v) * q⁻¹, but it is
+		expanded into v + w*t + u × t where u is the vector part of the
+		quaternion and t = 2(u × v)/|q|². For a unit quaternion |q|² = 1.
+
+		Args:
+			v: The vector to transform.
+
 		Returns:
 			A new vector representing the transformed result.
 		"""
-		
-		p = Quaternion(0, v.x, v.y, v.z)
+		w, x, y, z = self.w, self.x, self.y, self.z
 
-		# Use the conjugate instead of inverse if working with unit quaternions
-		t = (self.multiply(p)).multiply(self.inverse())
+		# One division keeps the result exact for quaternions that aren't unit length
+		s = 2 / (w*w + x*x + y*y + z*z)
 
-		return Vector3(t.x, t.y, t.z)
+		# t = 2(u × v)/|q|²
+		tx = s * (y*v.z - z*v.y)
+		ty = s * (z*v.x - x*v.z)
+		tz = s * (x*v.y - y*v.x)
+
+		# v + w*t + u × t
+		return Vector3(
+			v.x + w*tx + (y*tz - z*ty),
+			v.y + w*ty + (z*tx - x*tz),
+			v.z + w*tz + (x*ty - y*tx)
+		)
 
 	def conjugate(self) -> 'Quaternion':
 		"""
@@ -95,13 +170,16 @@ class Quaternion:
 			A new quaternion representing the inverse.
 		"""
 
-		norm_squared = self.w**2+self.x**2+self.y**2+self.z**2
+		w, x, y, z = self.w, self.x, self.y, self.z
+
+		# One division, then multiply each component by the reciprocal
+		inv_norm_squared = 1 / (w*w + x*x + y*y + z*z)
 
 		return Quaternion(
-			 self.w/norm_squared,
-			-self.x/norm_squared,
-			-self.y/norm_squared,
-			-self.z/norm_squared
+			 w * inv_norm_squared,
+			-x * inv_norm_squared,
+			-y * inv_norm_squared,
+			-z * inv_norm_squared
 		)
 
 	def copy(self) -> 'Quaternion':
@@ -135,8 +213,11 @@ class Quaternion:
 		Returns:
 			A new quaternion representing the result of the exponentiation.
 		"""
+		w, x, y, z = self.w, self.x, self.y, self.z
+
 		# Compute the norm (magnitude) of the quaternion
-		norm = math.sqrt(self.w**2 + self.x**2 + self.y**2 + self.z**2)
+		vector_squared = x*x + y*y + z*z
+		norm = math.sqrt(w*w + vector_squared)
 		
 		# Handle zero quaternion
 		if norm < 1e-10:
@@ -145,24 +226,69 @@ class Quaternion:
 		norm_pow = norm**exponent
 		
 		# Compute the angle theta
-		theta = math.acos(self.w / norm)
+		theta = math.acos(w / norm)
 		
 		# Compute the new scalar part
 		new_w = norm_pow * math.cos(exponent * theta)
 		
 		# If the vector part is zero, return a scalar quaternion
-		vector_magnitude = math.sqrt(self.x**2 + self.y**2 + self.z**2)
+		vector_magnitude = math.sqrt(vector_squared)
 		if vector_magnitude < 1e-10:
 			return Quaternion(new_w, 0, 0, 0)
 		
 		# Compute the new vector part
 		factor = norm_pow * math.sin(exponent * theta) / vector_magnitude
-		new_x = self.x * factor
-		new_y = self.y * factor
-		new_z = self.z * factor
+		new_x = x * factor
+		new_y = y * factor
+		new_z = z * factor
 		
 		return Quaternion(new_w, new_x, new_y, new_z)
 
+	def power_unit(self, exponent: Union[float, np.ndarray]) -> Union['Quaternion', 'QuaternionArray']:
+		"""
+		Raises this unit quaternion to the power of the given exponent.
+		
+		For a rotation by angle θ around an axis, this is the rotation by
+		exponent*θ around the same axis. It skips the norm calculations in
+		power(), so it is only correct for unit quaternions.
+		
+		Args:
+			exponent: The exponent to raise the quaternion to, or a 1D array of exponents.
+			
+		Returns:
+			A new quaternion representing the result of the exponentiation, or a
+			QuaternionArray with one quaternion per exponent if given an array.
+		"""
+		w, x, y, z = self.w, self.x, self.y, self.z
+
+		vector_squared = x*x + y*y + z*z
+		if vector_squared < 1e-20:
+			# The identity (or -identity) has no axis, so treat it as no rotation
+			x, y, z = 0, 0, 0
+			vector_magnitude, half_angle = 1, 0
+		else:
+			vector_magnitude = math.sqrt(vector_squared)
+			half_angle = math.atan2(vector_magnitude, w)
+
+		# Evaluate every exponent at once, sharing the axis and angle
+		if np.ndim(exponent) > 0:
+			from .quaternion_array import QuaternionArray
+
+			exponent = np.asarray(exponent, dtype=float)
+			if exponent.ndim != 1:
+				raise ValueError(f"Expected a 1D array of exponents, got shape {exponent.shape}")
+
+			half_angles = exponent * half_angle
+			factor = np.sin(half_angles) / vector_magnitude
+
+			return QuaternionArray([np.cos(half_angles), x * factor, y * factor, z * factor])
+
+		# Half of the rotation angle, scaled by the exponent
+		half_angle *= float(exponent)
+		factor = math.sin(half_angle) / vector_magnitude
+
+		return Quaternion(math.cos(half_angle), x * factor, y * factor, z * factor)
+
 	def toString(self, precision: int = 2) -> str:
 		"""
 		Return a string representation of the quaternion with controlled precision.
@@ -0,0 +1,461 @@
+import numpy as np
+from .quaternion import Quaternion
+
+try:
+	import numba
+except ImportError:
+	numba = None
+
+# Sign and permutation tables for the Hamilton product, such that
+# (a * b)[i] = sum_j _HAMILTON_SIGN[i, j] * a[j] * b[_HAMILTON_PERM[i, j]]
+_HAMILTON_SIGN = np.array([
+	[1, -1, -1, -1],
+	[1,  1,  1, -1],
+	[1, -1,  1,  1],
+	[1,  1, -1,  1]
+], dtype=float)
+
+_HAMILTON_PERM = np.array([
+	[0, 1, 2, 3],
+	[1, 0, 3, 2],
+	[2, 3, 0, 1],
+	[3, 2, 1, 0]
+])
+
+# The helpers below work on component-major arrays, where the first axis holds
+# the components (w, x, y, z or x, y, z) and the remaining axes index the batch.
+
+def _multiply_components(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+	"""
+	Hamilton product of component-major quaternion arrays of shape (4, ...).
+	"""
+	aw, ax, ay, az = a
+	bw, bx, by, bz = b
+
+	return np.array([
+		aw*bw - ax*bx - ay*by - az*bz,
+		aw*bx + ax*bw + ay*bz - az*by,
+		aw*by - ax*bz + ay*bw + az*bx,
+		aw*bz + ax*by - ay*bx + az*bw
+	])
+
+def _transform_components(q: np.ndarray, v: np.ndarray) -> np.ndarray:
+	"""
+	Rotate component-major vectors of shape (3, ...) by unit quaternions of shape (4, ...).
+	"""
+	w, x, y, z = q
+	vx, vy, vz = v
+
+	# t = 2(u × v)
+	tx = 2 * (y*vz - z*vy)
+	ty = 2 * (z*vx - x*vz)
+	tz = 2 * (x*vy - y*vx)
+
+	# v + w*t + u × t
+	return np.array([
+		vx + w*tx + (y*tz - z*ty),
+		vy + w*ty + (z*tx - x*tz),
+		vz + w*tz + (x*ty - y*tx)
+	])
+
+def _slerp_components(a: np.ndarray, b: np.ndarray, t, shortestPath: bool) -> np.ndarray:
+	"""
+	Spherical linear interpolation between component-major unit quaternions of shape (4, ...).
+	"""
+	t = np.asarray(t, dtype=float)
+
+	# t broadcasts against the batch axes, so a single pair gets one batch axis per
+	# axis of t; otherwise extra axes in t would line up with the component axis
+	batch_ndim = max(a.ndim, b.ndim) - 1
+	if batch_ndim == 0:
+		a = a.reshape(a.shape + (1,) * t.ndim)
+		b = b.reshape(b.shape + (1,) * t.ndim)
+	elif t.ndim > batch_ndim:
+		raise ValueError(f"Expected t to have at most {batch_ndim} dimension(s), got shape {t.shape}")
+
+	dot = np.sum(a * b, axis=0)
+
+	# Negate the targets that are on the far side of the hypersphere
+	if shortestPath:
+		b = np.where(dot < 0, -b, b)
+		dot = np.abs(dot)
+
+	theta = np.arccos(np.clip(dot, -1.0, 1.0))
+	sin_theta = np.sin(theta)
+
+	# Fall back to linear interpolation when the quaternions are (nearly) parallel
+	parallel = sin_theta < 1e-10
+	sin_theta = np.where(parallel, 1.0, sin_theta)
+	s0 = np.where(parallel, 1 - t, np.sin((1 - t) * theta) / sin_theta)
+	s1 = np.where(parallel, t, np.sin(t * theta) / sin_theta)
+
+	return s0 * a + s1 * b
+
+def _multiply_kernel(a: np.ndarray, b: np.ndarray, out: np.ndarray) -> None:
+	"""
+	Hamilton product of each column of a with the matching column of b, written into out.
+	"""
+	for i in range(a.shape[1]):
+		aw, ax, ay, az = a[0, i], a[1, i], a[2, i], a[3, i]
+		bw, bx, by, bz = b[0, i], b[1, i], b[2, i], b[3, i]
+		out[0, i] = aw*bw - ax*bx - ay*by - az*bz
+		out[1, i] = aw*bx + ax*bw + ay*bz - az*by
+		out[2, i] = aw*by - ax*bz + ay*bw + az*bx
+		out[3, i] = aw*bz + ax*by - ay*bx + az*bw
+
+def _transform_kernel(q: np.ndarray, v: np.ndarray, out: np.ndarray) -> None:
+	"""
+	Rotate each column of v by the matching column of q, written into out.
+	"""
+	for i in range(q.shape[1]):
+		w, x, y, z = q[0, i], q[1, i], q[2, i], q[3, i]
+		vx, vy, vz = v[0, i], v[1, i], v[2, i]
+		tx = 2 * (y*vz - z*vy)
+		ty = 2 * (z*vx - x*vz)
+		tz = 2 * (x*vy - y*vx)
+		out[0, i] = vx + w*tx + (y*tz - z*ty)
+		out[1, i] = vy + w*ty + (z*tx - x*tz)
+		out[2, i] = vz + w*tz + (x*ty - y*tx)
+
+# The kernels are only used when Numba can compile them; in the interpreter
+# the NumPy expressions above are much faster than a per-column loop. With
+# fastmath, LLVM vectorizes the loops over the component rows (AVX2 and FMA
+# where the CPU has them), so large batches are limited by memory bandwidth.
+if numba is not None:
+	_multiply_kernel = numba.njit(cache=True, fastmath=True)(_multiply_kernel)
+	_transform_kernel = numba.njit(cache=True, fastmath=True)(_transform_kernel)
+
+def _component_major(arr: np.ndarray) -> np.ndarray:
+	"""
+	View a packed array of shape (..., k) as component-major (k, ...) without copying.
+	"""
+	arr = np.asarray(arr, dtype=float)
+
+	# .T is the same view for 1D and 2D arrays and is much cheaper than moveaxis
+	return arr.T if arr.ndim <= 2 else np.moveaxis(arr, -1, 0)
+
+def _packed(arr: np.ndarray) -> np.ndarray:
+	"""
+	View a component-major array of shape (k, ...) as packed (..., k) without copying.
+	"""
+	return arr.T if arr.ndim <= 2 else np.moveaxis(arr, 0, -1)
+
+def _run_kernel(kernel, a: np.ndarray, b: np.ndarray, width: int, out: np.ndarray = None) -> np.ndarray:
+	"""
+	Broadcast the batch axes of the component-major arrays a and b, run a compiled
+	kernel over them, and return a component-major result with `width` components.
+	"""
+	a = np.asarray(a, dtype=float)
+	b = np.asarray(b, dtype=float)
+
+	# Matching flat batches need no broadcasting, which matters for small batches
+	if a.ndim == 2 and b.ndim == 2 and a.shape[1] == b.shape[1] and (out is None or out.ndim == 2):
+		if out is None:
+			out = np.empty((width, a.shape[1]))
+
+		kernel(a, b, out)
+		return out
+
+	shape = np.broadcast_shapes(a.shape[1:], b.shape[1:])
+
+	# Pad the batch axes on the left so they line up before broadcasting
+	a = a.reshape(a.shape[:1] + (1,) * (len(shape) + 1 - a.ndim) + a.shape[1:])
+	b = b.reshape(b.shape[:1] + (1,) * (len(shape) + 1 - b.ndim) + b.shape[1:])
+
+	a = np.broadcast_to(a, a.shape[:1] + shape).reshape(a.shape[0], -1)
+	b = np.broadcast_to(b, b.shape[:1] + shape).reshape(b.shape[0], -1)
+
+	if out is None:
+		out = np.empty((width,) + shape)
+
+	# Write through a flat view of out; copy back only if out can't be flattened in place
+	flat = out.reshape(width, -1)
+	kernel(a, b, flat)
+	if not np.shares_memory(flat, out):
+		out[...] = flat.reshape(out.shape)
+
+	return out
+
+def _check_width(arr: np.ndarray, width: int, name: str) -> None:
+	"""
+	Check that a packed array has `width` components along its last axis.
+
+	The compiled kernels have no bounds checks, so a narrower array would be
+	read past its end rather than raise.
+	"""
+	if arr.ndim == 0 or arr.shape[-1] != width:
+		raise ValueError(f"Expected {name} to be an array of shape (..., {width}), got {arr.shape}")
+
+def _out_view(out: np.ndarray, shape: tuple) -> np.ndarray:
+	"""
+	Check a caller-supplied out array and return it as a component-major view.
+
+	The compiled kernels have no bounds checks and must write into the caller's
+	memory, so out has to match the result exactly rather than be converted.
+	"""
+	if not isinstance(out, np.ndarray) or out.shape != shape:
+		raise ValueError(f"Expected out to be an array of shape {shape}, got {np.shape(out)}")
+
+	if out.dtype != np.float64:
+		raise ValueError(f"Expected out to have dtype float64, got {out.dtype}")
+
+	if not out.flags.writeable:
+		raise ValueError("Expected out to be writeable")
+
+	return out.T if out.ndim <= 2 else np.moveaxis(out, -1, 0)
+
+def multiply_batch(a: np.ndarray, b: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+	"""
+	Multiply two batches of quaternions stored as arrays of shape (N, 4).
+
+	The columns are the w, x, y, z components. Shapes broadcast, so a single
+	quaternion of shape (4,) can be multiplied against a whole batch.
+
+	Args:
+		a: The left-hand quaternions.
+		b: The right-hand quaternions.
+		out: Optional float64 array of shape (N, 4) to write the products into, so
+			that repeated calls in a loop don't allocate.
+
+	Returns:
+		An array of shape (N, 4) holding the products (out, if given).
+	"""
+	a = np.asarray(a, dtype=float)
+	b = np.asarray(b, dtype=float)
+	_check_width(a, 4, "a")
+	_check_width(b, 4, "b")
+
+	if out is not None:
+		out_view = _out_view(out, np.broadcast_shapes(a.shape, b.shape))
+
+	if numba is not None:
+		if out is not None:
+			_run_kernel(_multiply_kernel, _component_major(a), _component_major(b), 4, out_view)
+			return out
+
+		return _packed(_run_kernel(_multiply_kernel, _component_major(a), _component_major(b), 4))
+
+	# Each component of the product is a signed dot product of a with a permutation of b
+	return np.einsum('...j,ij,...ij->...i', a, _HAMILTON_SIGN, b[..., _HAMILTON_PERM], out=out)
+
+def transform_batch(q: np.ndarray, v: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+	"""
+	Transform a batch of vectors by a batch of unit quaternions.
+
+	Uses the identity v' = v + w*t + u x t where u is the vector part of the
+	quaternion and t = 2(u x v), which avoids building the sandwich product.
+
+	Args:
+		q: The unit quaternions, shape (N, 4) or (4,).
+		v: The vectors to transform, shape (N, 3) or (3,).
+		out: Optional float64 array of shape (N, 3) to write the transformed vectors into.
+
+	Returns:
+		An array of shape (N, 3) holding the transformed vectors (out, if given).
+	"""
+	q = np.asarray(q, dtype=float)
+	v = np.asarray(v, dtype=float)
+	_check_width(q, 4, "q")
+	_check_width(v, 3, "v")
+
+	if out is not None:
+		out_view = _out_view(out, np.broadcast_shapes(q.shape[:-1], v.shape[:-1]) + (3,))
+
+	if numba is not None:
+		if out is not None:
+			_run_kernel(_transform_kernel, _component_major(q), _component_major(v), 3, out_view)
+			return out
+
+		return _packed(_run_kernel(_transform_kernel, _component_major(q), _component_major(v), 3))
+
+	result = _packed(_transform_components(_component_major(q), _component_major(v)))
+
+	if out is not None:
+		np.copyto(out, result)
+		return out
+
+	return result
+
+def slerp_batch(a: np.ndarray, b: np.ndarray, t, shortestPath: bool = True) -> np.ndarray:
+	"""
+	Spherical linear interpolation between batches of unit quaternions.
+
+	Args:
+		a: The starting quaternions, shape (N, 4) or (4,).
+		b: The ending quaternions, shape (N, 4) or (4,).
+		t: The interpolation parameter(s) in [0, 1], a scalar or shape (N,). For a
+			single pair of quaternions, t may be an array of shape (K,) to sample
+			the path at K points.
+		shortestPath: Whether to ensure shortest path (default: True).
+
+	Returns:
+		An array of shape (N, 4) holding the interpolated quaternions, or (K, 4)
+		for a single pair.
+	"""
+	return _packed(_slerp_components(_component_major(a), _component_major(b), t, shortestPath))
+
+class QuaternionArray:
+	"""
+	A batch of quaternions stored in structure-of-arrays layout.
+
+	The components live in one contiguous array of shape (4, N), so each of
+	w, x, y, z is a contiguous array of length N and the batch operations
+	read every component with unit stride.
+	"""
+
+	def __init__(self, components: np.ndarray):
+		"""
+		Construct a batch of quaternions from a component-major array of shape (4, N).
+
+		Args:
+			components: The w, x, y, z components, one row each.
+		"""
+		components = np.ascontiguousarray(components, dtype=float)
+
+		if components.ndim != 2 or components.shape[0] != 4:
+			raise ValueError(f"Expected an array of shape (4, N), got {components.shape}")
+
+		self.components = components
+		self.w, self.x, self.y, self.z = components
+
+	@staticmethod
+	def from_array(arr: np.ndarray) -> 'QuaternionArray':
+		"""
+		Construct a batch from an array of shape (N, 4), one quaternion per row.
+
+		Args:
+			arr: The quaternions with columns w, x, y, z.
+
+		Returns:
+			A new quaternion array holding the same values.
+		"""
+		arr = np.asarray(arr, dtype=float)
+
+		if arr.ndim != 2 or arr.shape[1] != 4:
+			raise ValueError(f"Expected an array of shape (N, 4), got {arr.shape}")
+
+		return QuaternionArray(arr.T)
+
+	@staticmethod
+	def from_quaternions(quaternions: list[Quaternion]) -> 'QuaternionArray':
+		"""
+		Construct a batch from a list of quaternions.
+
+		Args:
+			quaternions: The quaternions to pack into the batch.
+
+		Returns:
+			A new quaternion array holding the same values.
+		"""
+		return QuaternionArray([
+			[q.w for q in quaternions],
+			[q.x for q in quaternions],
+			[q.y for q in quaternions],
+			[q.z for q in quaternions]
+		])
+
+	@staticmethod
+	def from_scipy(rotation) -> 'QuaternionArray':
+		"""
+		Construct a batch from a scipy.spatial.transform.Rotation holding many rotations.
+
+		Args:
+			rotation: The SciPy rotations to convert.
+
+		Returns:
+			A new quaternion array of unit quaternions.
+		"""
+		# SciPy stores quaternions scalar-last as (x, y, z, w)
+		x, y, z, w = np.atleast_2d(rotation.as_quat()).T
+
+		return QuaternionArray([w, x, y, z])
+
+	def to_scipy(self):
+		"""
+		Convert this batch to a scipy.spatial.transform.Rotation.
+
+		SciPy is an optional dependency and is only imported when this is called.
+
+		Returns:
+			A SciPy rotation holding the same rotations (normalized by SciPy).
+		"""
+		from scipy.spatial.transform import Rotation
+
+		return Rotation.from_quat(np.stack([self.x, self.y, self.z, self.w], axis=-1))
+
+	def to_array(self) -> np.ndarray:
+		"""
+		Return the quaternions as an array of shape (N, 4), one quaternion per row.
+
+		Returns:
+			A (non-contiguous) view of the components.
+		"""
+		return self.components.T
+
+	def multiply(self, other: 'QuaternionArray') -> 'QuaternionArray':
+		"""
+		Multiply each quaternion in this batch by the matching quaternion in another batch.
+
+		A batch of length 1 is multiplied against every quaternion in the other batch.
+
+		Args:
+			other: The quaternions to multiply by.
+
+		Returns:
+			A new quaternion array holding the products.
+		"""
+		if numba is not None:
+			return QuaternionArray(_run_kernel(_multiply_kernel, self.components, other.components, 4))
+
+		return QuaternionArray(_multiply_components(self.components, other.components))
+
+	def transform(self, v: np.ndarray) -> np.ndarray:
+		"""
+		Transform vectors by the (unit) quaternions in this batch.
+
+		Args:
+			v: The vectors to transform, shape (N, 3) or (3,).
+
+		Returns:
+			An array of shape (N, 3) holding the transformed vectors.
+		"""
+		v = np.asarray(v, dtype=float)
+		_check_width(v, 3, "v")
+		v = _component_major(v)
+
+		if numba is not None:
+			return _run_kernel(_transform_kernel, self.components, v, 3).T
+
+		return _transform_components(self.components, v).T
+
+	def slerp(self, other: 'QuaternionArray', t, shortestPath: bool = True) -> 'QuaternionArray':
+		"""
+		Spherical linear interpolation from this batch towards another batch.
+
+		Args:
+			other: The ending quaternions.
+			t: The interpolation parameter(s) in [0, 1], a scalar or shape (N,).
+			shortestPath: Whether to ensure shortest path (default: True).
+
+		Returns:
+			A new quaternion array holding the interpolated quaternions.
+		"""
+		return QuaternionArray(_slerp_components(self.components, other.components, t, shortestPath))
+
+	def __len__(self) -> int:
+		"""
+		Return the number of quaternions in the batch.
+		"""
+		return self.components.shape[1]
+
+	def __getitem__(self, i: int) -> Quaternion:
+		"""
+		Return the quaternion at index i as a scalar Quaternion.
+		"""
+		return Quaternion(float(self.w[i]), float(self.x[i]), float(self.y[i]), float(self.z[i]))
+
+	def __repr__(self) -> str:
+		"""
+		Return a detailed string representation of the quaternion array.
+		"""
+		return f"QuaternionArray({self.components!r})"
@@ -0,0 +1,205 @@
+import math
+import pytest
+import numpy as np
+from .vector3 import Vector3
+from .quaternion import Quaternion
+from . import quaternion_array
+from .quaternion_array import QuaternionArray, multiply_batch, transform_batch, slerp_batch
+from .assert_equal import assert_equal
+
+@pytest.fixture(autouse=True, params=["numba", "numpy"])
+def backend(request, monkeypatch):
+	"""
+	Run every test against both the compiled Numba kernels and the NumPy fallback.
+	"""
+	if request.param == "numba":
+		pytest.importorskip("numba")
+	else:
+		monkeypatch.setattr(quaternion_array, "numba", None)
+
+	return request.param
+
+def test_multiply_batch():
+
+	a = Quaternion.from_axis_angle(Vector3(1, 0, 0), math.pi/2)
+	b = Quaternion.from_axis_angle(Vector3(1, 1, 1), -2*math.pi/3)
+	c = Quaternion(0.83, 0.34, -0.44, 0.02)
+
+	left = QuaternionArray.from_quaternions([a, b, c])
+	right = QuaternionArray.from_quaternions([b, c, a])
+
+	product = left.multiply(right)
+
+	assert len(product) == 3
+	assert_equal(product[0], a.multiply(b))
+	assert_equal(product[1], b.multiply(c))
+	assert_equal(product[2], c.multiply(a))
+
+def test_transform_batch():
+
+	a = Quaternion.from_axis_angle(Vector3(1, 0, 0), math.pi/2)
+	b = Quaternion.from_axis_angle(Vector3(1, 1, 1), -2*math.pi/3)
+	q = b.multiply(a)
+
+	batch = QuaternionArray.from_quaternions([q, q, q])
+	points = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+
+	transformed = batch.transform(points)
+
+	assert_equal(Vector3(*transformed[0]), Vector3(0, 0, 1))
+	assert_equal(Vector3(*transformed[1]), Vector3(0, 1, 0))
+	assert_equal(Vector3(*transformed[2]), Vector3(-1, 0, 0))
+
+def test_slerp_batch():
+
+	q1 = Quaternion(1, 0, 0, 0)
+	q2 = Quaternion.from_axis_angle(Vector3(0, 0, 1), math.pi/2)
+
+	start = QuaternionArray.from_quaternions([q1, q1, q1])
+	end = QuaternionArray.from_quaternions([q2, q2, q2])
+
+	result = start.slerp(end, np.array([0, 0.5, 1]))
+
+	assert_equal(result[0], q1)
+	assert_equal(result[1], Quaternion.from_axis_angle(Vector3(0, 0, 1), math.pi/4))
+	assert_equal(result[2], q2)
+
+	# -q2 is the same rotation, so the shortest path should end at -q2
+	negated = QuaternionArray.from_quaternions([q2.scale(-1)])
+	result = QuaternionArray.from_quaternions([q1]).slerp(negated, 0.5)
+
+	assert_equal(result[0], Quaternion.from_axis_angle(Vector3(0, 0, 1), math.pi/4))
+
+def test_structure_of_arrays_layout():
+
+	arr = np.array([
+		[1, 0, 0, 0],
+		[0.83, 0.34, -0.44, 0.02]
+	])
+
+	batch = QuaternionArray.from_array(arr)
+
+	# Each component is stored contiguously
+	assert batch.components.shape == (4, 2)
+	assert batch.x.flags['C_CONTIGUOUS']
+	assert np.array_equal(batch.x, [0, 0.34])
+
+	assert np.array_equal(batch.to_array(), arr)
+	assert_equal(batch[1], Quaternion(0.83, 0.34, -0.44, 0.02))
+
+def test_packed_batch_functions():
+
+	a = Quaternion.from_axis_angle(Vector3(1, 0, 0), math.pi/2)
+	b = Quaternion.from_axis_angle(Vector3(1, 1, 1), -2*math.pi/3)
+
+	# A single quaternion broadcasts against a batch of rows
+	single = np.array([b.w, b.x, b.y, b.z])
+	rows = np.array([[a.w, a.x, a.y, a.z], [1, 0, 0, 0]])
+
+	product = multiply_batch(single, rows)
+
+	assert product.shape == (2, 4)
+	assert_equal(Quaternion(*product[0]), b.multiply(a))
+	assert_equal(Quaternion(*product[1]), b)
+
+	transformed = transform_batch(product[0], np.eye(3))
+
+	assert_equal(Vector3(*transformed[0]), Vector3(0, 0, 1))
+	assert_equal(Vector3(*transformed[1]), Vector3(0, 1, 0))
+	assert_equal(Vector3(*transformed[2]), Vector3(-1, 0, 0))
+
+	halfway = slerp_batch(rows[1], single, 0.5)
+
+	assert_equal(Quaternion(*halfway), Quaternion.from_axis_angle(Vector3(1, 1, 1), -math.pi/3))
+
+def test_slerp_batch_samples_one_pair():
+
+	q1 = Quaternion(1, 0, 0, 0)
+	q2 = Quaternion.from_axis_angle(Vector3(0, 0, 1), math.pi/2)
+
+	ts = np.linspace(0, 1, 4)
+	frames = slerp_batch([q1.w, q1.x, q1.y, q1.z], [q2.w, q2.x, q2.y, q2.z], ts)
+
+	assert frames.shape == (4, 4)
+	for frame, t in zip(frames, ts):
+		assert_equal(Quaternion(*frame), Quaternion.from_axis_angle(Vector3(0, 0, 1), t * math.pi/2))
+
+	# A batch of pairs can't also be sampled along a second axis of t
+	with pytest.raises(ValueError):
+		slerp_batch(np.tile(frames[0], (3, 1)), np.tile(frames[-1], (3, 1)), np.ones((2, 3)))
+
+def test_scipy_round_trip():
+
+	pytest.importorskip("scipy")
+
+	a = Quaternion.from_axis_angle(Vector3(1, 0, 0), math.pi/2)
+	b = Quaternion.from_axis_angle(Vector3(1, 1, 1), -2*math.pi/3)
+	batch = QuaternionArray.from_quaternions([a, b])
+
+	rotation = batch.to_scipy()
+
+	assert len(rotation) == 2
+	assert np.allclose(rotation.apply(np.eye(3)[:2]), batch.transform(np.eye(3)[:2]))
+
+	result = QuaternionArray.from_scipy(rotation)
+
+	assert_equal(result[0], a)
+	assert_equal(result[1], b)
+
+def test_batch_functions_write_into_out():
+
+	a = Quaternion.from_axis_angle(Vector3(1, 0, 0), math.pi/2)
+	b = Quaternion.from_axis_angle(Vector3(1, 1, 1), -2*math.pi/3)
+	rows = np.array([[a.w, a.x, a.y, a.z], [b.w, b.x, b.y, b.z]])
+
+	out = np.empty((2, 4))
+	result = multiply_batch(rows, rows[::-1], out=out)
+
+	assert result is out
+	assert_equal(Quaternion(*out[0]), a.multiply(b))
+	assert_equal(Quaternion(*out[1]), b.multiply(a))
+
+	out = np.empty((2, 3))
+	result = transform_batch(rows, np.array([[0, 1, 0], [1, 0, 0]]), out=out)
+
+	assert result is out
+	assert_equal(Vector3(*out[0]), a.transform(Vector3(0, 1, 0)))
+	assert_equal(Vector3(*out[1]), b.transform(Vector3(1, 0, 0)))
+
+def test_batch_functions_accept_lists():
+
+	assert np.array_equal(multiply_batch([1, 0, 0, 0], [0, 1, 0, 0]), [0, 1, 0, 0])
+	assert np.allclose(transform_batch([0, 0, 0, 1], [1, 0, 0]), [-1, 0, 0])
+
+def test_batch_functions_reject_bad_out():
+
+	rows = np.tile([1.0, 0, 0, 0], (3, 1))
+	vectors = np.eye(3)
+
+	# Inputs with the wrong number of components
+	with pytest.raises(ValueError):
+		multiply_batch(np.ones((3, 3)), np.ones((3, 3)))
+	with pytest.raises(ValueError):
+		transform_batch(vectors, vectors)
+	with pytest.raises(ValueError):
+		transform_batch(rows, np.ones((3, 2)))
+	with pytest.raises(ValueError):
+		QuaternionArray.from_array(rows).transform(np.ones((3, 2)))
+
+	# Too small for the result
+	with pytest.raises(ValueError):
+		multiply_batch(rows, rows, out=np.zeros((1, 4)))
+	with pytest.raises(ValueError):
+		transform_batch(rows, vectors, out=np.zeros((1, 3)))
+
+	# Not float64, so the result could only be written to a copy
+	out = np.zeros((3, 4), dtype=np.float32)
+	with pytest.raises(ValueError):
+		multiply_batch(rows, rows, out=out)
+	assert not out.any()
+
+	# Read-only
+	out = np.zeros((3, 3))
+	out.flags.writeable = False
+	with pytest.raises(ValueError):
+		transform_batch(rows, vectors, out=out)
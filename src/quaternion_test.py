@@ -1,4 +1,6 @@
 import math
+import pytest
+import numpy as np
 from .vector3 import Vector3
 from .quaternion import Quaternion
 from .assert_equal import assert_equal
@@ -59,6 +61,23 @@ def test_rotation_other_way():
 	assert_equal(q.transform(j_hat), Vector3(1, 0, 0))
 	assert_equal(q.transform(k_hat), Vector3(0, 0, 1))
 
+def test_transform_non_unit():
+
+	q = Quaternion.from_axis_angle(Vector3(1, 0, 0), math.pi/2)
+
+	# Scaling a quaternion doesn't change the rotation it represents
+	for s in (2, 0.5, -3):
+		scaled = q.scale(s)
+
+		assert_equal(scaled.transform(Vector3(0, 1, 0)), Vector3(0, 0, 1))
+		assert_equal(scaled.transform(Vector3(0, 0, 1)), Vector3(0, -1, 0))
+
+	# Matches the sandwich product q * (0, v) * q⁻¹
+	q = Quaternion(0.83, 0.34, -0.44, 0.02)
+	p = q.multiply(Quaternion(0, 1, 2, 3)).multiply(q.inverse())
+
+	assert_equal(q.transform(Vector3(1, 2, 3)), Vector3(p.x, p.y, p.z))
+
 def test_multiply():
 
 	i = Quaternion(0, 1, 0, 0)
@@ -121,3 +140,63 @@ def test_power_for_rotations():
 	q_power_half = q.power(0.5)
 	expected_half = Quaternion.from_axis_angle(Vector3(0, 0, 1), math.pi/4)
 	assert_equal(q_power_half, expected_half)
+
+def test_scipy_round_trip():
+
+	pytest.importorskip("scipy")
+
+	q = Quaternion.from_axis_angle(Vector3(1, 1, 1), -2*math.pi/3)
+
+	rotation = q.to_scipy()
+
+	assert_equal(Vector3(*rotation.apply([1, 0, 0])), q.transform(Vector3(1, 0, 0)))
+	assert_equal(Quaternion.from_scipy(rotation), q)
+
+def test_power_unit():
+
+	q = Quaternion.from_axis_angle(Vector3(1, 1, 1), -2*math.pi/3)
+
+	for exponent in [0, 0.25, 0.5, 1, 2]:
+		assert_equal(q.power_unit(exponent), q.power(exponent))
+
+	# The identity stays the identity for any exponent
+	assert_equal(Quaternion(1, 0, 0, 0).power_unit(0.5), Quaternion(1, 0, 0, 0))
+
+def test_power_unit_array():
+
+	q = Quaternion.from_axis_angle(Vector3(0, 0, 1), math.pi/2)
+
+	exponents = np.array([0, 0.5, 1, 2])
+	powers = q.power_unit(exponents)
+
+	assert len(powers) == len(exponents)
+
+	for i, exponent in enumerate(exponents):
+		assert_equal(powers[i], q.power_unit(float(exponent)))
+
+	# A 0-d array is a single exponent, not a batch
+	power = q.power_unit(np.array(0.5))
+
+	assert isinstance(power, Quaternion)
+	assert_equal(power, q.power_unit(0.5))
+
+	with pytest.raises(ValueError):
+		q.power_unit(np.ones((2, 2)))
+
+def test_multiply_normalized():
+
+	a = Quaternion.from_axis_angle(Vector3(1, 0, 0), math.pi/2)
+	b = Quaternion.from_axis_angle(Vector3(1, 1, 1), -2*math.pi/3)
+
+	# Unit quaternions multiply to a unit quaternion, so nothing changes
+	assert_equal(a.multiply_normalized(b), a.multiply(b))
+
+	# Scaled inputs give the same rotation back at unit length
+	assert_equal(a.scale(2).multiply_normalized(b.scale(0.5)), a.multiply(b))
+
+def test_inverse():
+
+	q = Quaternion(0.83, 0.34, -0.44, 0.02).scale(3)
+
+	assert_equal(q.multiply(q.inverse()), Quaternion(1, 0, 0, 0))
+	assert_equal(q.inverse().multiply(q), Quaternion(1, 0, 0, 0))
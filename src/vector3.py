@@ -4,6 +4,8 @@ class Vector3:
   """
   Represents a three-dimensional vector.
   """
+
+  __slots__ = ('x', 'y', 'z')
   
   def __init__(self, x: float = 0, y: float = 0, z: float = 0):
     """
@@ -85,7 +87,8 @@ class Vector3:
     Returns:
       The length of the vector.
     """
-    return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+    x, y, z = self.x, self.y, self.z
+    return math.sqrt(x * x + y * y + z * z)
   
   def is_zero(self) -> bool:
     """
@@ -131,8 +134,8 @@ class Vector3:
     Returns:
       A new Vector3 representing the normalized vector.
     """
-    length = self.length()
-    return Vector3(self.x / length, self.y / length, self.z / length)
+    inv_length = 1 / self.length()
+    return Vector3(self.x * inv_length, self.y * inv_length, self.z * inv_length)
 
   def __iter__(self):
     """